@@ -10,25 +10,17 @@ Output YAML format:
 tasks:
   - Task: "Task Name"
     Work Package: "WP1: Default"
-    Start: "YYYY-MM-DD"
-    End: "YYYY-MM-DD"
+    Start: 1
+    End: 3
     Type: "Task"
 """
 
-import pandas as pd
 import argparse
+import csv
 import sys
 import os
-from datetime import datetime, timedelta
-
-# Optional YAML import
-try:
-    import yaml
-
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
-    yaml = None
+import re
+from operator import itemgetter
 
 
 def parse_arguments():
@@ -70,174 +62,335 @@ def load_milestones(milestones_file):
     """
     Load milestones from CSV file
 
+    The file is opened and its columns are validated immediately; rows
+    are only read as the returned iterator is consumed.
+
     Args:
         milestones_file: Path to milestones CSV file
 
     Returns:
-        List of milestone dictionaries
+        Iterator of milestone dictionaries
+    """
+    milestones = _iter_milestones(milestones_file)
+    # Run up to the first yield, which opens the file and checks the header
+    next(milestones)
+    return milestones
+
+
+def _iter_milestones(milestones_file):
+    """
+    Build milestone dictionaries from CSV rows one at a time
+
+    The first value yielded is None, once the file has been opened and its
+    columns validated. The file stays open only while the generator is
+    running and is closed when it is exhausted or closed.
+
+    Args:
+        milestones_file: Path to milestones CSV file
+
+    Yields:
+        None, then milestone dictionaries
     """
     try:
-        df_milestones = pd.read_csv(milestones_file)
+        f = open(milestones_file, newline="", encoding="utf-8-sig")
+    except FileNotFoundError:
+        print(f"Error: Milestones file '{milestones_file}' not found.")
+        sys.exit(1)
     except Exception as e:
         print(f"Error reading milestones CSV file: {e}")
         sys.exit(1)
 
-    # Validate required columns
-    required_columns = ["Milestone number", "Milestone name", "Due date (in month)"]
-    missing_columns = [
-        col for col in required_columns if col not in df_milestones.columns
-    ]
-
-    if missing_columns:
-        print(
-            f"Error: Missing required columns in milestones file: {', '.join(missing_columns)}"
-        )
-        print(f"Available columns: {', '.join(df_milestones.columns)}")
-        sys.exit(1)
+    with f:
+        try:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or []
+        except Exception as e:
+            print(f"Error reading milestones CSV file: {e}")
+            sys.exit(1)
 
-    # Check if Related WP(s) column exists
-    has_related_wps = "Related WP(s)" in df_milestones.columns
-
-    milestones = []
-    for _, row in df_milestones.iterrows():
-        milestone = {
-            "Task": f"{row['Milestone number'].strip()} - {row['Milestone name'].strip()}",
-            "Work Package": "Milestones",  # Default work package for milestones
-            "Start": int(row["Due date (in month)"]),
-            "End": int(row["Due date (in month)"]),  # Same start and end for milestones
-            "Type": "Milestone",
-        }
+        # Validate required columns
+        required_columns = [
+            "Milestone number",
+            "Milestone name",
+            "Due date (in month)",
+        ]
+        available_columns = frozenset(fieldnames)
+        missing_columns = [
+            col for col in required_columns if col not in available_columns
+        ]
+
+        if missing_columns:
+            print(
+                f"Error: Missing required columns in milestones file: {', '.join(missing_columns)}"
+            )
+            print(f"Available columns: {', '.join(fieldnames)}")
+            sys.exit(1)
 
-        # Add Related WP(s) if available
-        if has_related_wps and pd.notna(row["Related WP(s)"]):
-            milestone["Related WPs"] = row["Related WP(s)"].strip()
+        # Check if Related WP(s) column exists
+        has_related_wps = "Related WP(s)" in available_columns
+
+        # Number, name and due month of each milestone row, fetched together
+        get_columns = itemgetter(*required_columns)
+
+        yield
+
+        for i, row in enumerate(reader, start=1):
+            number, name, due = get_columns(row)
+            try:
+                due_month = int(due)
+                milestone_name = f"{number.strip()} - {name.strip()}"
+            except (AttributeError, TypeError, ValueError) as e:
+                raise ValueError(f"Row {i}: {e}") from e
+            milestone = {
+                "Task": milestone_name,
+                "Work Package": "Milestones",  # Default work package for milestones
+                "Start": due_month,
+                "End": due_month,  # Same start and end for milestones
+                "Type": "Milestone",
+            }
+
+            # Add Related WP(s) if available
+            if has_related_wps:
+                related_wps = (row["Related WP(s)"] or "").strip()
+                if related_wps:
+                    milestone["Related WPs"] = related_wps
+
+            yield milestone
+
+
+# Characters that must be escaped inside a double-quoted YAML scalar: the
+# quote and backslash, C0/C1 controls, YAML line breaks (\x85, \u2028,
+# \u2029), the BOM and other non-printable code points
+_YAML_ESCAPE = re.compile(
+    r'["\\\x00-\x1f\x7f-\x9f\u2028\u2029\ufeff\ufffe\uffff\ud800-\udfff]'
+)
+_YAML_NAMED_ESCAPES = {
+    "\\": "\\\\",
+    '"': '\\"',
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+}
+
+
+def _escape_char(match):
+    """Escape a single character matched by _YAML_ESCAPE"""
+    char = match.group()
+    escaped = _YAML_NAMED_ESCAPES.get(char)
+    if escaped is None:
+        code = ord(char)
+        escaped = f"\\x{code:02X}" if code <= 0xFF else f"\\u{code:04X}"
+    return escaped
+
+
+def _q(value):
+    """
+    Quote a string as a double-quoted YAML scalar
 
-        milestones.append(milestone)
+    Args:
+        value: String to quote
 
-    return milestones
+    Returns:
+        The quoted string, safe to embed in a YAML mapping value
+    """
+    return f'"{_YAML_ESCAPE.sub(_escape_char, value)}"'
 
 
-def convert_csv_to_yaml(csv_file, output_file, task_type, milestones_file=None):
+def _format_task(t):
     """
-    Convert CSV file to YAML format
+    Format a single task as a YAML sequence item using a fixed template
+
+    The output schema is known in advance, so each task block is built
+    with a single f-string instead of going through PyYAML's generic
+    representer/emitter.
 
     Args:
-        csv_file: Path to input CSV file
-        output_file: Path to output YAML file
-        task_type: Default task type
-        milestones_file: Optional path to milestones CSV file
+        t: Task dictionary
+
+    Returns:
+        The complete YAML block for the task, ready to be written in one call
     """
+    related_wps = (
+        f"    Related WPs: {_q(t['Related WPs'])}\n" if "Related WPs" in t else ""
+    )
+    return (
+        f"  - Task: {_q(t['Task'])}\n"
+        f"    Work Package: {_q(t['Work Package'])}\n"
+        f"    Start: {t['Start']}\n"
+        f"    End: {t['End']}\n"
+        f"    Type: {_q(t['Type'])}\n"
+        f"{related_wps}"
+    )
 
-    # Read CSV file
-    try:
-        df = pd.read_csv(csv_file)
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        sys.exit(1)
 
-    # Validate required columns
-    required_columns = [
-        "Task Number",
-        "Task Name",
-        "Task Start Month",
-        "Task End Month",
-        "Work Package",
-    ]
-    missing_columns = [col for col in required_columns if col not in df.columns]
-
-    if missing_columns:
-        print(f"Error: Missing required columns: {', '.join(missing_columns)}")
-        print(f"Available columns: {', '.join(df.columns)}")
-        sys.exit(1)
+def _iter_tasks(rows, task_type):
+    """
+    Build task dictionaries from CSV rows one at a time
+
+    Args:
+        rows: Iterable of CSV row dictionaries
+        task_type: Default task type
+
+    Yields:
+        Task dictionaries
+    """
+    # Pull the needed columns out of each row in a single C-level call
+    get_columns = itemgetter(
+        "Task Number", "Task Name", "Task Start Month", "Task End Month", "Work Package"
+    )
 
-    # Convert to YAML format
-    tasks = []
+    # Task type indexed by whether start and end months coincide
+    types = (task_type, "Milestone")
 
-    for _, row in df.iterrows():
-        # Get month numbers directly from CSV
-        start_month = int(row["Task Start Month"])
-        end_month = int(row["Task End Month"])
+    for i, (number, name, start, end, work_package) in enumerate(
+        map(get_columns, rows), start=1
+    ):
+        try:
+            # Get month numbers directly from CSV
+            start_month = int(start)
+            end_month = int(end)
 
-        # Use Work Package from CSV
-        csv_work_package = (
-            row["Work Package"].strip()
-            if pd.notna(row["Work Package"])
-            else "WP1: Default"
-        )
+            # Use Work Package from CSV
+            csv_work_package = (work_package or "").strip() or "WP1: Default"
 
-        # Combine Task Number and Task Name
-        task_name = f"{row['Task Number'].strip()} - {row['Task Name'].strip()}"
+            # Combine Task Number and Task Name
+            task_name = f"{number.strip()} - {name.strip()}"
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"Row {i}: {e}") from e
 
-        task = {
+        yield {
             "Task": task_name,
             "Work Package": csv_work_package,
             "Start": start_month,
             "End": end_month,
-            "Type": task_type if start_month != end_month else "Milestone",
+            "Type": types[start_month == end_month],
         }
 
-        tasks.append(task)
 
-    # Load milestones if provided
-    if milestones_file:
-        if not os.path.exists(milestones_file):
-            print(f"Error: Milestones file '{milestones_file}' not found.")
-            sys.exit(1)
-        print(f"Loading milestones from: {milestones_file}")
-        milestones = load_milestones(milestones_file)
-        tasks.extend(milestones)
-        print(f"Added {len(milestones)} milestones")
+def _remove_quietly(path):
+    """
+    Remove a file, ignoring errors (e.g. if it was never created)
 
-    # Create YAML structure
-    yaml_data = {"tasks": tasks}
+    Args:
+        path: Path of the file to remove
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
-    # Write YAML file
-    if YAML_AVAILABLE:
+
+def convert_csv_to_yaml(csv_file, output_file, task_type, milestones_file=None):
+    """
+    Convert CSV file to YAML format
+
+    Tasks are streamed from the CSV file straight into the YAML file, so
+    only the summary statistics are kept in memory.
+
+    Args:
+        csv_file: Path to input CSV file
+        output_file: Path to output YAML file
+        task_type: Default task type
+        milestones_file: Optional path to milestones CSV file
+    """
+
+    # Open CSV file
+    try:
+        csv_f = open(csv_file, newline="", encoding="utf-8-sig")
+        reader = csv.DictReader(csv_f)
+        fieldnames = reader.fieldnames or []
+    except FileNotFoundError:
+        print(f"Error: CSV file '{csv_file}' not found.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        sys.exit(1)
+
+    with csv_f:
+        # Validate required columns
+        required_columns = [
+            "Task Number",
+            "Task Name",
+            "Task Start Month",
+            "Task End Month",
+            "Work Package",
+        ]
+        available_columns = frozenset(fieldnames)
+        missing_columns = [
+            col for col in required_columns if col not in available_columns
+        ]
+
+        if missing_columns:
+            print(f"Error: Missing required columns: {', '.join(missing_columns)}")
+            print(f"Available columns: {', '.join(fieldnames)}")
+            sys.exit(1)
+
+        # Tasks first, then milestones if provided
+        sources = [("CSV file", _iter_tasks(reader, task_type))]
+        if milestones_file:
+            print(f"Loading milestones from: {milestones_file}")
+            sources.append(("milestones CSV file", load_milestones(milestones_file)))
+
+        # Stream tasks to a temporary file next to the output, collecting the
+        # summary on the way; it only replaces the output once fully written
+        tmp_file = f"{output_file}.tmp"
+        task_count = 0
+        source_counts = []
+        work_packages = set()
+        min_start = float("inf")
+        max_end = -float("inf")
         try:
-            with open(output_file, "w") as f:
-                yaml.dump(
-                    yaml_data, f, default_flow_style=False, sort_keys=False, indent=2
-                )
-            print(f"✓ Successfully converted {len(tasks)} tasks to {output_file}")
+            with open(tmp_file, "w", buffering=1 << 16, encoding="utf-8") as f:
+                f.write("tasks:\n")
+                for source_name, items in sources:
+                    source_start = task_count
+                    for t in items:
+                        f.write(_format_task(t))
+                        task_count += 1
+                        work_packages.add(t["Work Package"])
+                        if t["Start"] < min_start:
+                            min_start = t["Start"]
+                        if t["End"] > max_end:
+                            max_end = t["End"]
+                    source_counts.append(task_count - source_start)
+                if not task_count:
+                    # Nothing followed the header, keep "tasks" an empty list
+                    f.seek(0)
+                    f.write("tasks: []\n")
+            os.replace(tmp_file, output_file)
+        except (ValueError, csv.Error) as e:
+            _remove_quietly(tmp_file)
+            print(f"Error reading {source_name}: {e}")
+            sys.exit(1)
         except Exception as e:
+            _remove_quietly(tmp_file)
             print(f"Error writing YAML file: {e}")
             sys.exit(1)
-    else:
-        # Fallback: write as JSON-like structure
-        print("Warning: PyYAML not available. Writing as JSON format.")
-        try:
-            import json
+        finally:
+            # Close any source not read to the end, e.g. the milestones file
+            for _, items in sources:
+                items.close()
 
-            with open(output_file.replace(".yaml", ".json"), "w") as f:
-                json.dump(yaml_data, f, indent=2)
-            print(
-                f"✓ Successfully converted {len(tasks)} tasks to {output_file.replace('.yaml', '.json')}"
-            )
-        except Exception as e:
-            print(f"Error writing JSON file: {e}")
-            sys.exit(1)
+    if milestones_file:
+        print(f"Added {source_counts[1]} milestones")
+    print(f"✓ Successfully converted {task_count} tasks to {output_file}")
 
     # Print summary
     print(f"\nConversion Summary:")
     print(f"  Input file: {csv_file}")
     print(f"  Output file: {output_file}")
-    print(f"  Total tasks: {len(tasks)}")
-    work_packages = sorted(set([t["Work Package"] for t in tasks]))
-    print(f"  Work packages: {', '.join(work_packages)}")
-    print(
-        f"  Month range: {min([t['Start'] for t in tasks])} to {max([t['End'] for t in tasks])}"
-    )
+    print(f"  Total tasks: {task_count}")
+    print(f"  Work packages: {', '.join(sorted(work_packages))}")
+    if task_count:
+        print(f"  Month range: {min_start} to {max_end}")
+    else:
+        print("  Month range: N/A")
 
 
 def main():
     """Main function"""
     args = parse_arguments()
 
-    # Check if input file exists
-    if not os.path.exists(args.csv_file):
-        print(f"Error: CSV file '{args.csv_file}' not found.")
-        sys.exit(1)
-
     # Determine output file name
     if args.output:
         output_file = args.output
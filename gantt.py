@@ -1,20 +1,99 @@
+import sys
+import matplotlib
+
+# When run headless (--no-display), use the non-interactive Agg backend so no
+# GUI toolkit is loaded, and let Agg simplify and chunk long paths
+if __name__ == "__main__" and "--no-display" in sys.argv:
+    matplotlib.use("Agg")
+    matplotlib.rcParams["path.simplify"] = True
+    matplotlib.rcParams["path.simplify_threshold"] = 1.0
+    matplotlib.rcParams["agg.path.chunksize"] = 10000
+
 import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
 import pandas as pd
-from datetime import datetime, timedelta
 import numpy as np
-import argparse
-import sys
+import functools
+import importlib.util
 import os
 
-# Optional YAML import
-try:
-    import yaml
+# Optional YAML support (PyYAML is only imported when a YAML file is loaded)
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
+
+# Label box drawn behind task names inside bars (matplotlib copies it per text)
+TASK_BBOX = dict(
+    boxstyle="round,pad=0.2",
+    facecolor="white",
+    alpha=0.8,
+    edgecolor="none",
+)
+
+
+@functools.lru_cache(maxsize=512)
+def format_milestone_name(milestone_name):
+    """
+    Format milestone names with line wrapping
+    """
+    # Wrap text at 20 characters without splitting words
+    if len(milestone_name) <= 20:
+        return milestone_name
+
+    words = milestone_name.split()
+    lines = []
+    current_line = ""
+
+    for word in words:
+        # Check if adding this word would exceed 20 characters
+        if current_line and len(current_line + " " + word) > 20:
+            lines.append(current_line)
+            current_line = word
+        elif current_line:
+            current_line += " " + word
+        else:
+            current_line = word
+
+    # Add the last line if it exists
+    if current_line:
+        lines.append(current_line)
 
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
-    yaml = None
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=512)
+def format_wp_name(wp_name):
+    """
+    Format work package name with line wrapping
+    """
+    # Convert "WP1: System Design" to "WP1\System Design"
+    if ": " in wp_name:
+        parts = wp_name.split(": ", 1)
+        formatted = f"{parts[0]}\\{parts[1]}"
+    else:
+        formatted = wp_name
+
+    # Wrap text at 20 characters without splitting words
+    if len(formatted) <= 20:
+        return formatted
+
+    words = formatted.split()
+    lines = []
+    current_line = ""
+
+    for word in words:
+        # Check if adding this word would exceed 20 characters
+        if current_line and len(current_line + " " + word) > 20:
+            lines.append(current_line)
+            current_line = word
+        elif current_line:
+            current_line += " " + word
+        else:
+            current_line = word
+
+    # Add the last line if it exists
+    if current_line:
+        lines.append(current_line)
+
+    return "\n".join(lines)
 
 
 def create_gantt_chart(data, title="Project Gantt Chart"):
@@ -22,7 +101,7 @@ def create_gantt_chart(data, title="Project Gantt Chart"):
     Creates a static Gantt chart from project data
 
     Parameters:
-    data: list of dictionaries with keys:
+    data: DataFrame or list of dictionaries with keys:
         - 'Task': task name
         - 'Work Package': work package name
         - 'Start': start month (1-12)
@@ -30,119 +109,154 @@ def create_gantt_chart(data, title="Project Gantt Chart"):
         - 'Type': 'Task' or 'Milestone'
     """
 
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
+    # Convert to DataFrame (a shallow copy, so added columns don't leak back)
+    if isinstance(data, pd.DataFrame):
+        df = data.copy(deep=False)
+    else:
+        df = pd.DataFrame(data)
 
-    # Convert month numbers to positions for visualization
     # Bars span from Start to End months
-    df["Start_Month"] = df["Start"]
-    df["End_Month"] = df["End"]
-    df["Duration"] = df["End_Month"] - df["Start_Month"]
+    df["Duration"] = df["End"].to_numpy() - df["Start"].to_numpy()
+
+    # Integer code per work package, in order of first appearance
+    work_packages = df["Work Package"].unique()
+    df["WP_code"] = pd.Categorical(df["Work Package"], categories=work_packages).codes
 
     # Separate tasks and milestones
-    tasks = df[df["Type"] == "Task"].copy()
-    milestones = df[df["Type"] == "Milestone"].copy()
+    # (read-only selections, so no copies are needed)
+    types = df["Type"].to_numpy()
+    tasks = df[types == "Task"]
+    milestones = df[types == "Milestone"]
 
     # Create figure and axis
-    fig, ax = plt.subplots(figsize=(16, 10))
+    fig, ax = plt.subplots(figsize=(16, 10), constrained_layout=True)
 
-    # Color palette for work packages
-    work_packages = df["Work Package"].unique()
+    # Color palette for work packages, indexed by WP_code
     colors = plt.cm.Set3(np.linspace(0, 1, len(work_packages)))
     wp_colors = dict(zip(work_packages, colors))
 
-    # Plot tasks as horizontal bars
-    y_pos = 0
-    y_labels = []
-    y_positions = []
+    # Map work package identifiers ("WP1" in "WP1: System Design" or
+    # "WP1 - System Design") and full names to their colors
+    wp_ident_to_color = {}
+    for full_wp, color in wp_colors.items():
+        wp_ident_to_color.setdefault(full_wp, color)
+        ident = full_wp.replace(":", " ").split(maxsplit=1)
+        if ident:
+            wp_ident_to_color.setdefault(ident[0], color)
+
+    # Order tasks by work package (in order of first appearance), keeping the
+    # original order within each work package
+    tasks = tasks.sort_values("WP_code", kind="stable").reset_index(drop=True)
+
+    # Plot all tasks as horizontal bars in a single call
+    y_pos = len(tasks)
     wp_y_ranges = {}  # Track y-position ranges for each work package
 
-    for wp in work_packages:
-        wp_tasks = tasks[tasks["Work Package"] == wp]
-
-        if not wp_tasks.empty:
-            # Track start position for this work package
-            wp_start_y = y_pos
-
-            # No work package header - just process tasks directly
-            for _, task in wp_tasks.iterrows():
-                # Plot task bar
-                bar = ax.barh(
-                    y_pos,
-                    task["Duration"],
-                    left=task["Start_Month"],
-                    height=1.0,  # Full height for tight layout
-                    color=wp_colors[wp],
-                    alpha=0.7,
-                    edgecolor="black",
-                    linewidth=0.5,
-                )
+    if not tasks.empty:
+        task_y = np.arange(len(tasks))
+        task_starts = tasks["Start"].to_numpy()
+        task_durations = tasks["Duration"].to_numpy()
+        task_colors = colors[tasks["WP_code"].to_numpy()]
+
+        ax.barh(
+            task_y,
+            task_durations,
+            left=task_starts,
+            height=1.0,  # Full height for tight layout
+            color=task_colors,
+            alpha=0.7,
+            edgecolor="black",
+            linewidth=0.5,
+        )
 
-                # Add task name within the bar
-                bar_center_x = task["Start_Month"] + task["Duration"] / 2
-                bar_width = task["Duration"]
-
-                # Only add text if bar is wide enough
-                if bar_width >= 0.5:  # Minimum width for readable text (0.5 months)
-                    ax.text(
-                        bar_center_x,
-                        y_pos,
-                        task["Task"],
-                        ha="center",
-                        va="center",
-                        fontsize=8,
-                        fontweight="bold",
-                        color="black",
-                        bbox=dict(
-                            boxstyle="round,pad=0.2",
-                            facecolor="white",
-                            alpha=0.8,
-                            edgecolor="none",
-                        ),
-                    )
-                else:
-                    # For narrow bars, put text to the right
-                    ax.text(
-                        task["Start_Month"] + task["Duration"] + 0.1,
-                        y_pos,
-                        task["Task"],
-                        ha="left",
-                        va="center",
-                        fontsize=8,
-                        fontweight="bold",
-                        color=wp_colors[wp],
-                    )
+        # Add task names within the bar if it is wide enough, otherwise to
+        # the right of it (0.5 months is the minimum width for readable text)
+        task_names = tasks["Task"].to_numpy()
+        wide = task_durations >= 0.5
+        centered_labels = zip(
+            task_starts[wide] + task_durations[wide] / 2,
+            task_y[wide],
+            task_names[wide],
+        )
+        right_labels = zip(
+            task_starts[~wide] + task_durations[~wide] + 0.1,
+            task_y[~wide],
+            task_names[~wide],
+            task_colors[~wide],
+        )
 
-                # Add empty y-axis entry (no label)
-                y_labels.append("")
-                y_positions.append(y_pos)
-                y_pos += 1
+        for x, y, name in centered_labels:
+            ax.text(
+                x,
+                y,
+                name,
+                ha="center",
+                va="center",
+                fontsize=8,
+                fontweight="bold",
+                color="black",
+                bbox=TASK_BBOX,
+            )
 
-            # Store the range for this work package
-            wp_y_ranges[wp] = (wp_start_y, y_pos - 1)
+        for x, y, name, color in right_labels:
+            ax.text(
+                x,
+                y,
+                name,
+                ha="left",
+                va="center",
+                fontsize=8,
+                fontweight="bold",
+                color=color,
+            )
 
-        # No spacing between work packages for tight layout
-        # y_pos += 0.5  # Removed this line
+        # Store the range for each work package
+        for wp, idx in tasks.groupby("Work Package", sort=False).indices.items():
+            wp_y_ranges[wp] = (idx[0], idx[-1])
 
     # Draw milestones based on Related WPs
-    for _, milestone in milestones.iterrows():
-        milestone_x = milestone["Start_Month"]
+    # Stripes of multi-WP milestones are collected here and drawn as a single
+    # LineCollection after the loop
+    stripe_segments = []
+    stripe_colors = []
+
+    # Create fine stripes - each stripe is 0.2 units tall
+    y_bottom, y_top = ax.get_ylim()
+    total_height = y_top - y_bottom
+    stripe_height = 0.2
+    num_stripes = int(total_height / stripe_height) + 1
+    stripe_starts = y_bottom + np.arange(num_stripes) * stripe_height
+    stripe_starts = stripe_starts[stripe_starts < y_top]
+    stripe_ends = np.minimum(stripe_starts + stripe_height, y_top)
+    # Stripe extents in axes coordinates (0 = bottom, 1 = top), as for axvline
+    stripe_ymin = (stripe_starts - y_bottom) / total_height
+    stripe_ymax = (stripe_ends - y_bottom) / total_height
+
+    # Pull the milestone columns out once instead of building a Series per row
+    milestone_xs = milestones["Start"].to_numpy()
+    if "Related WPs" in milestones.columns:
+        milestone_related = milestones["Related WPs"].to_numpy()
+    else:
+        milestone_related = np.full(len(milestones), None)
 
+    for milestone_x, related in zip(milestone_xs, milestone_related):
         # Check if milestone has Related WPs field
-        if "Related WPs" in milestone and pd.notna(milestone["Related WPs"]):
+        if pd.notna(related):
             # Parse Related WPs (could be "WP1", "WP2, WP3", etc.)
-            related_wps = [
-                wp.strip() for wp in str(milestone["Related WPs"]).split(",")
-            ]
+            related_wps = [wp.strip() for wp in str(related).split(",")]
 
             # Get colors for the related work packages
             milestone_colors = []
             for wp_name in related_wps:
-                # Find the full work package name that contains this WP identifier
-                for full_wp in wp_colors.keys():
-                    if wp_name in full_wp:
-                        milestone_colors.append(wp_colors[full_wp])
-                        break
+                color = wp_ident_to_color.get(wp_name)
+                if color is None:
+                    # Find the full work package name that contains this WP identifier
+                    color = next(
+                        (c for full_wp, c in wp_colors.items() if wp_name in full_wp),
+                        None,
+                    )
+                if color is not None:
+                    milestone_colors.append(color)
 
             # Draw striped or solid line based on number of colors
             if len(milestone_colors) == 1:
@@ -157,32 +271,24 @@ def create_gantt_chart(data, title="Project Gantt Chart"):
                     zorder=10,
                 )
             elif len(milestone_colors) > 1:
-                # Multiple colors - create fine striped effect
-                y_bottom, y_top = ax.get_ylim()
-                total_height = y_top - y_bottom
-
-                # Create fine stripes - each stripe is 0.2 units tall
-                stripe_height = 0.2
-                num_stripes = int(total_height / stripe_height) + 1
-
-                for i in range(num_stripes):
-                    # Alternate colors for fine striping
-                    color_index = i % len(milestone_colors)
-                    color = milestone_colors[color_index]
-
-                    y_start = y_bottom + i * stripe_height
-                    y_end = min(y_start + stripe_height, y_top)
-
-                    if y_start < y_top:
-                        ax.axvline(
-                            x=milestone_x,
-                            ymin=(y_start - y_bottom) / total_height,
-                            ymax=(y_end - y_bottom) / total_height,
-                            color=color,
-                            linewidth=3,
-                            alpha=0.8,
-                            zorder=10,
-                        )
+                # Multiple colors - alternate colors for fine striping
+                xs = np.full_like(stripe_ymin, milestone_x)
+                stripe_segments.append(
+                    np.stack(
+                        [
+                            np.column_stack([xs, stripe_ymin]),
+                            np.column_stack([xs, stripe_ymax]),
+                        ],
+                        axis=1,
+                    )
+                )
+                stripe_colors.append(
+                    np.take(
+                        milestone_colors,
+                        np.arange(len(stripe_ymin)) % len(milestone_colors),
+                        axis=0,
+                    )
+                )
             else:
                 # No matching colors found - use default gray
                 ax.axvline(
@@ -206,56 +312,38 @@ def create_gantt_chart(data, title="Project Gantt Chart"):
                 zorder=10,
             )
 
-    # Function to format milestone names with line wrapping
-    def format_milestone_name(milestone_name):
-        # Wrap text at 20 characters without splitting words
-        if len(milestone_name) <= 20:
-            return milestone_name
-
-        words = milestone_name.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            # Check if adding this word would exceed 20 characters
-            if current_line and len(current_line + " " + word) > 20:
-                lines.append(current_line)
-                current_line = word
-            elif current_line:
-                current_line += " " + word
-            else:
-                current_line = word
-
-        # Add the last line if it exists
-        if current_line:
-            lines.append(current_line)
-
-        return "\n".join(lines)
+    if stripe_segments:
+        # x in data coordinates, y in axes coordinates (like axvline)
+        ax.add_collection(
+            LineCollection(
+                np.concatenate(stripe_segments),
+                colors=np.concatenate(stripe_colors),
+                linewidths=3,
+                alpha=0.8,
+                zorder=10,
+                capstyle="projecting",
+                transform=ax.get_xaxis_transform(),
+            ),
+            autolim=False,
+        )
 
     # Organize and add milestone labels at the top
     if not milestones.empty:
-        # Sort milestones by position
-        milestone_positions = [
-            (row["Start_Month"], row["Task"]) for _, row in milestones.iterrows()
-        ]
-        milestone_positions.sort()
+        # Sort milestones by position (then name)
+        sorted_milestones = milestones.sort_values(["Start", "Task"], kind="stable")
+        xs_sorted = sorted_milestones["Start"].to_numpy()
+        names_sorted = sorted_milestones["Task"].to_numpy()
 
         # Calculate label positions to avoid overlaps
-        label_y_positions = []
         base_y = -1  # Position at top of chart (negative y in inverted coordinates)
 
-        for i, (x_pos, task_name) in enumerate(milestone_positions):
-            # Stagger labels at different heights to avoid overlaps
-            # Use multiple rows if milestones are close together
-            if i > 0 and abs(x_pos - milestone_positions[i - 1][0]) < 4:
-                # Close to previous milestone - use different height
-                row = (i % 3) + 1  # Use 3 rows maximum
-                label_y = base_y - row * 1.5
-            else:
-                # Far enough from previous - use base height
-                label_y = base_y - 0.5
+        # Stagger labels at different heights to avoid overlaps
+        # Use multiple rows if milestones are close together
+        close_to_prev = np.concatenate([[False], np.abs(np.diff(xs_sorted)) < 4])
+        row = (np.arange(len(xs_sorted)) % 3) + 1  # Use 3 rows maximum
+        label_ys = np.where(close_to_prev, base_y - row * 1.5, base_y - 0.5)
 
-            label_y_positions.append((x_pos, label_y, task_name))
+        label_y_positions = zip(xs_sorted, label_ys, names_sorted)
 
         # Draw the organized milestone labels
         for x_pos, label_y, task_name in label_y_positions:
@@ -292,10 +380,9 @@ def create_gantt_chart(data, title="Project Gantt Chart"):
 
     # Format x-axis (months)
     # Set fixed x-axis range from 1 to 37, but extend left for braces
-    month_range = range(0, 37)  # 1 to 37 inclusive
+    months = np.arange(0, 37)  # 0 to 36 inclusive
     ax.set_xlim(-3, 37)  # Extend left to make room for braces and labels
-    ax.set_xticks(list(month_range))
-    ax.set_xticklabels(list(month_range))
+    ax.set_xticks(months)  # Tick labels come from the default formatter
     plt.xticks(rotation=0)
 
     # Add grid
@@ -306,40 +393,9 @@ def create_gantt_chart(data, title="Project Gantt Chart"):
     # ax.set_ylabel("Tasks and Milestones")
     ax.set_title(title, fontsize=16, fontweight="bold", pad=20)
 
-    # Function to format work package name
-    def format_wp_name(wp_name):
-        # Convert "WP1: System Design" to "WP1\System Design"
-        if ": " in wp_name:
-            parts = wp_name.split(": ", 1)
-            formatted = f"{parts[0]}\\{parts[1]}"
-        else:
-            formatted = wp_name
-
-        # Wrap text at 20 characters without splitting words
-        if len(formatted) <= 20:
-            return formatted
-
-        words = formatted.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            # Check if adding this word would exceed 20 characters
-            if current_line and len(current_line + " " + word) > 20:
-                lines.append(current_line)
-                current_line = word
-            elif current_line:
-                current_line += " " + word
-            else:
-                current_line = word
-
-        # Add the last line if it exists
-        if current_line:
-            lines.append(current_line)
-
-        return "\n".join(lines)
-
     # Draw curly braces and labels for each work package
+    # Brace line segments are collected and drawn as a single LineCollection
+    brace_segments = []
     for wp, (start_y, end_y) in wp_y_ranges.items():
         wp_color = wp_colors[wp]  # Get the color for this work package
         formatted_wp = format_wp_name(wp)
@@ -363,24 +419,14 @@ def create_gantt_chart(data, title="Project Gantt Chart"):
 
             # Draw curly brace (simplified bracket facing right)
             brace_x = -0.8
-            # Top horizontal line
-            ax.plot(
-                [brace_x, brace_x + 0.2],
-                [start_y - 0.4, start_y - 0.4],
-                "k-",
-                linewidth=1.5,
-            )
-            # Vertical line
-            ax.plot(
-                [brace_x, brace_x], [start_y - 0.4, end_y + 0.4], "k-", linewidth=1.5
-            )
-            # Bottom horizontal line
-            ax.plot(
-                [brace_x, brace_x + 0.2],
-                [end_y + 0.4, end_y + 0.4],
-                "k-",
-                linewidth=1.5,
-            )
+            brace_segments += [
+                # Top horizontal line
+                [(brace_x, start_y - 0.4), (brace_x + 0.2, start_y - 0.4)],
+                # Vertical line
+                [(brace_x, start_y - 0.4), (brace_x, end_y + 0.4)],
+                # Bottom horizontal line
+                [(brace_x, end_y + 0.4), (brace_x + 0.2, end_y + 0.4)],
+            ]
 
             # Add work package label (closer and tilted)
             ax.text(
@@ -395,7 +441,17 @@ def create_gantt_chart(data, title="Project Gantt Chart"):
                 color=wp_color,
             )
 
-    plt.tight_layout()
+    if brace_segments:
+        ax.add_collection(
+            LineCollection(
+                brace_segments,
+                colors="black",
+                linewidths=1.5,
+                capstyle="projecting",
+                zorder=2,  # Same as the Line2D artists ax.plot would create
+            )
+        )
+
     return fig, ax
 
 
@@ -575,6 +631,8 @@ def parse_arguments():
     """
     Parse command-line arguments for the Gantt chart generator
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Generate a Gantt chart from project data",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -646,38 +704,56 @@ def validate_data(data):
     """
     required_columns = ["Task", "Work Package", "Start", "End", "Type"]
 
-    if not data:
-        raise ValueError("No data loaded. Please check your file format.")
+    if isinstance(data, pd.DataFrame):
+        if data.empty:
+            raise ValueError("No data loaded. Please check your file format.")
+        df = data
+    else:
+        if not data:
+            raise ValueError("No data loaded. Please check your file format.")
+
+        # Check if data is a list of dictionaries
+        if not isinstance(data, list) or not all(
+            isinstance(item, dict) for item in data
+        ):
+            raise ValueError("Data must be a list of dictionaries.")
 
-    # Check if data is a list of dictionaries
-    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
-        raise ValueError("Data must be a list of dictionaries.")
+        df = pd.DataFrame(data)
 
     # Check required columns
-    missing_columns = set(required_columns) - set(data[0].keys())
+    missing_columns = set(required_columns) - set(df.columns)
     if missing_columns:
         raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
 
-    # Check for empty values (but allow 0 as valid value)
-    for i, item in enumerate(data):
-        for col in required_columns:
-            value = item.get(col)
-            # Check if value is None, empty string, or NaN (but allow 0)
-            # Handle NumPy arrays and pandas data types properly
-            if value is None:
-                raise ValueError(f"Row {i+1}: Missing value for column '{col}'")
-            elif isinstance(value, str):
-                if value.strip() == "":
-                    raise ValueError(f"Row {i+1}: Missing value for column '{col}'")
-            elif hasattr(value, "__len__") and not isinstance(value, (int, float)):
-                # Handle arrays/lists - check if they're empty
-                if len(value) == 0:
-                    raise ValueError(f"Row {i+1}: Missing value for column '{col}'")
-            elif pd.isna(value):
-                # Handle pandas NaN values
-                raise ValueError(f"Row {i+1}: Missing value for column '{col}'")
-
-    print(f"✓ Data validation passed. Loaded {len(data)} items.")
+    # Check for empty values (but allow 0 as valid value), one column at a time
+    values = df[required_columns]
+    missing = values.isna()
+    for col in required_columns:
+        column = values[col]
+        if not (
+            pd.api.types.is_object_dtype(column)
+            or pd.api.types.is_string_dtype(column)
+        ):
+            continue
+        if pd.api.types.infer_dtype(column, skipna=True) == "string":
+            # Empty or whitespace-only strings, vectorised for all-string columns
+            missing[col] |= column.str.strip().eq("").to_numpy(
+                dtype=bool, na_value=False
+            )
+        else:
+            # Mixed columns: blank strings or empty arrays/lists, element by element
+            missing[col] |= column.map(
+                lambda value: not value.strip()
+                if isinstance(value, str)
+                else hasattr(value, "__len__") and len(value) == 0
+            ).to_numpy(dtype=bool)
+    bad_rows = missing.to_numpy().any(axis=1)
+    if bad_rows.any():
+        i = int(bad_rows.argmax())
+        col = required_columns[int(missing.iloc[i].to_numpy().argmax())]
+        raise ValueError(f"Row {i+1}: Missing value for column '{col}'")
+
+    print(f"✓ Data validation passed. Loaded {len(df)} items.")
     return True
 
 
@@ -692,20 +768,57 @@ def load_from_yaml(yaml_file_path):
             "PyYAML is not installed. Install it with: pip install PyYAML"
         )
 
-    with open(yaml_file_path, "r") as file:
-        data = yaml.safe_load(file)
+    import yaml
+
+    # Prefer the libyaml-backed C loader, falling back to the pure-Python one
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+
+    with open(yaml_file_path, "rb") as file:
+        data = yaml.load(file, Loader=YamlLoader)
 
     # Handle both direct list format and nested 'tasks' format
     if isinstance(data, list):
-        return data
+        return pd.DataFrame(data)
     elif isinstance(data, dict) and "tasks" in data:
-        return data["tasks"]
+        return pd.DataFrame(data["tasks"])
     else:
         raise ValueError(
             "YAML file must contain either a list of tasks or a 'tasks' key with a list"
         )
 
 
+# Alternative function to import from CSV
+def load_from_csv(csv_file_path):
+    """
+    Load project data from CSV file
+    Expected columns: Task, Work Package, Start (month 1-12), End (month 1-12), Type
+    """
+    try:
+        # Multi-threaded Arrow parser with Arrow-backed columns, if available
+        return pd.read_csv(csv_file_path, engine="pyarrow", dtype_backend="pyarrow")
+    except (ImportError, ValueError):
+        # pyarrow missing, or a file it rejects (e.g. rows with fewer fields
+        # than the header) that the default parser accepts; ParserError and
+        # pyarrow's ArrowInvalid are both ValueErrors
+        return pd.read_csv(csv_file_path)
+
+
+# Alternative function to create from Excel
+def load_from_excel(excel_file_path, sheet_name=0):
+    """
+    Load project data from Excel file
+    Expected columns: Task, Work Package, Start (month 1-12), End (month 1-12), Type
+    """
+    try:
+        # Rust-based calamine reader (python-calamine), if available
+        return pd.read_excel(excel_file_path, sheet_name=sheet_name, engine="calamine")
+    except ImportError:
+        return pd.read_excel(excel_file_path, sheet_name=sheet_name)
+
+
 # Generate and display the chart
 if __name__ == "__main__":
     # Parse command-line arguments
@@ -775,38 +888,18 @@ if __name__ == "__main__":
             plt.show()
 
         # Print summary
+        summary = pd.DataFrame(data)
+        type_counts = summary["Type"].value_counts()
         print("\n" + "=" * 50)
         print("Gantt chart generated successfully!")
         print(f"Title: {args.title}")
         print(
-            f"Project spans from month {min([item['Start'] for item in data])} to month {max([item['End'] for item in data])}"
-        )
-        print(f"Total tasks: {len([item for item in data if item['Type'] == 'Task'])}")
-        print(
-            f"Total milestones: {len([item for item in data if item['Type'] == 'Milestone'])}"
+            f"Project spans from month {summary['Start'].min()} to month {summary['End'].max()}"
         )
+        print(f"Total tasks: {type_counts.get('Task', 0)}")
+        print(f"Total milestones: {type_counts.get('Milestone', 0)}")
         print("=" * 50)
 
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
-
-
-# Alternative function to import from CSV
-def load_from_csv(csv_file_path):
-    """
-    Load project data from CSV file
-    Expected columns: Task, Work Package, Start (month 1-12), End (month 1-12), Type
-    """
-    df = pd.read_csv(csv_file_path)
-    return df.to_dict("records")
-
-
-# Alternative function to create from Excel
-def load_from_excel(excel_file_path, sheet_name=0):
-    """
-    Load project data from Excel file
-    Expected columns: Task, Work Package, Start (month 1-12), End (month 1-12), Type
-    """
-    df = pd.read_excel(excel_file_path, sheet_name=sheet_name)
-    return df.to_dict("records")